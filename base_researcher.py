@@ -0,0 +1,844 @@
+"""Early-life research workflow built on ADK multi-agent pipelines."""
+
+import asyncio
+import contextvars
+import dataclasses
+import functools
+import os
+import re
+import time
+import secrets
+from collections import Counter, OrderedDict
+from typing import AsyncGenerator, AsyncIterator
+
+import httpx
+from google.adk.agents import (
+    Agent,
+    BaseAgent,
+    LoopAgent,
+    ParallelAgent,
+    SequentialAgent,
+)
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.events import Event, EventActions
+from google.adk.flows.llm_flows import functions as _adk_llm_functions
+from google.adk.runners import InMemoryRunner, Runner
+from google.adk.sessions import InMemorySessionService
+from google.adk.tools import FunctionTool
+from google.genai import types
+
+from early_life_prompts import (
+    answer_instructions,
+    refiner_instructions,
+    research_aspects,
+    reviewer_instructions,
+    sub_researcher_instructions,
+)
+
+MODEL = "gemini-2.0-flash"
+
+# Cached answers are reused for repeated queries within this window; the
+# early life of a politician does not change, but sources do occasionally.
+CACHE_MAX_ENTRIES = 128
+CACHE_TTL_SECONDS = 15 * 60
+
+
+class _TokenBucket:
+    """Proactive rate limiter: refills ``rate_per_min`` tokens per minute."""
+
+    def __init__(self, rate_per_min: int):
+        self.rate_per_min = rate_per_min
+        self._tokens = float(rate_per_min)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Waits until a token is available, then consumes it."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.rate_per_min),
+                    self._tokens + (now - self._updated) * self.rate_per_min / 60,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * 60 / self.rate_per_min
+            await asyncio.sleep(wait)
+
+_parallel_tool_calls_enabled = False
+
+
+def _enable_parallel_tool_calls():
+    """Makes ADK await concurrent FunctionCalls with asyncio.gather.
+
+    google-adk 0.5.0 executes the FunctionCalls of a single model response
+    serially. Each Tavily call is ~0.5-2s of network wait, so when the model
+    emits several searches in one response the serial loop costs their sum
+    instead of their max. This patches handle_function_calls_async to split a
+    multi-call event into single-call events and gather them.
+    """
+    global _parallel_tool_calls_enabled
+    if _parallel_tool_calls_enabled:
+        return
+    original = _adk_llm_functions.handle_function_calls_async
+
+    async def _parallel_handle(invocation_context, function_call_event, tools_dict, *args, **kwargs):
+        call_indices = [
+            i
+            for i, part in enumerate(function_call_event.content.parts)
+            if part.function_call
+        ]
+        if len(call_indices) <= 1:
+            return await original(
+                invocation_context, function_call_event, tools_dict, *args, **kwargs
+            )
+        single_events = []
+        for i in call_indices:
+            single = function_call_event.model_copy(deep=True)
+            single.content.parts = [single.content.parts[i]]
+            single_events.append(single)
+        responses = await asyncio.gather(
+            *[
+                original(invocation_context, event, tools_dict, *args, **kwargs)
+                for event in single_events
+            ]
+        )
+        responses = [response for response in responses if response is not None]
+        if not responses:
+            return None
+        if len(responses) == 1:
+            return responses[0]
+        # ADK's own merger carries over actions (state_delta, auth requests,
+        # transfers) from every response, not just the parts.
+        return _adk_llm_functions.merge_parallel_function_response_events(
+            responses
+        )
+
+    _adk_llm_functions.handle_function_calls_async = _parallel_handle
+    _parallel_tool_calls_enabled = True
+
+
+_enable_parallel_tool_calls()
+
+
+_TAVILY_ENDPOINT = "https://api.tavily.com/search"
+_TAVILY_MAX_RESULTS = 5
+_TAVILY_SEARCH_DEPTH = "advanced"
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared keep-alive HTTP client; amortizes the TLS handshake."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=30)
+    return _http_client
+
+
+# Per-invocation Tavily query cache. _run_events installs a fresh dict
+# before each workflow run and resets it afterwards; tasks spawned inside
+# the run inherit the same dict, so the parallel sub-agents share hits.
+_tavily_query_cache: contextvars.ContextVar[dict | None] = contextvars.ContextVar(
+    "tavily_query_cache", default=None
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tavily_api_key() -> str:
+    # Imported lazily: Secret Manager (and its credentials) is only needed
+    # when the key is not already in the environment.
+    key = os.environ.get("TAVILY_API_KEY")
+    if key:
+        return key
+    from services.gcp import get_secret
+
+    return get_secret()
+
+
+async def _tavily_post(query: str) -> dict:
+    """Posts one search to Tavily and returns the response payload."""
+    response = await _get_http_client().post(
+        _TAVILY_ENDPOINT,
+        json={
+            "api_key": _get_tavily_api_key(),
+            "query": query,
+            "max_results": _TAVILY_MAX_RESULTS,
+            "search_depth": _TAVILY_SEARCH_DEPTH,
+            "include_answer": True,
+            # Tavily's own snippets are enough for the research notes; raw
+            # page content would multiply the bytes in flight and the
+            # prompt tokens.
+            "include_raw_content": False,
+        },
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+async def tavily_search(query: str) -> dict:
+    """Searches the web with Tavily.
+
+    Args:
+        query (str): The search query.
+
+    Returns:
+        dict: The search results and Tavily's short answer.
+    """
+    # Within one workflow run, equivalent queries (same text modulo case
+    # and whitespace) from different sub-agents share a single API call:
+    # the first caller starts the request as a task, the rest await it.
+    cache = _tavily_query_cache.get()
+    if cache is None:
+        payload = await _tavily_post(query)
+    else:
+        key = _WHITESPACE_RE.sub(" ", query.strip().lower())
+        task = cache.get(key)
+        if task is None:
+            task = asyncio.create_task(_tavily_post(query))
+            cache[key] = task
+        payload = await task
+    return {
+        "results": payload.get("results", []),
+        "answer": payload.get("answer"),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tavily_tool() -> FunctionTool:
+    """Shared Tavily tool; built once per process instead of per flow.
+
+    A FunctionTool over an async function: ADK's run_async awaits coroutine
+    functions, so the search never blocks the event loop. The earlier
+    LangchainTool wrapper bound the wrapped tool's synchronous _run, which
+    posted with blocking requests no matter what _arun did.
+    """
+    return FunctionTool(func=tavily_search)
+
+
+def _parse_gap_queries(review_result: str) -> list[str]:
+    """Extracts the gap-filling search queries from a failed review."""
+    if not review_result.startswith("NEEDS_IMPROVEMENT:"):
+        return []
+    _, _, queries = review_result.partition("|")
+    return [query.strip() for query in queries.split(";") if query.strip()]
+
+
+# Strong references to in-flight prefetch tasks; asyncio only keeps weak
+# ones, so unreferenced tasks could be garbage-collected mid-flight.
+_prefetch_tasks: set = set()
+
+
+def _speculative_prefetch(callback_context):
+    """Starts the reviewer's gap searches while the refiner LLM call runs.
+
+    When the review fails, its feedback names the searches that would fill
+    the gaps. Firing them here, instead of waiting for the refiner to ask
+    for them, overlaps their network latency with the refiner round-trip:
+    each prefetch is seeded into the per-run dedupe cache, so the refiner's
+    matching calls await the already-running task instead of posting again.
+    Without the cache there is nothing to seed and prefetching would only
+    burn quota, so the whole step is skipped outside a run.
+    """
+    cache = _tavily_query_cache.get()
+    if cache is None:
+        return None
+    review_result = callback_context.state.get("review_result", "")
+    for query in _parse_gap_queries(review_result):
+        key = _WHITESPACE_RE.sub(" ", query.strip().lower())
+        if key in cache:
+            continue
+        task = asyncio.create_task(_tavily_post(query))
+        cache[key] = task
+        _prefetch_tasks.add(task)
+
+        def _on_done(task, key=key, cache=cache):
+            _prefetch_tasks.discard(task)
+            # Retrieve the exception so a failed speculative search does
+            # not log "Task exception was never retrieved", and evict it
+            # from the cache so a real call retries instead of inheriting
+            # the failure.
+            if not task.cancelled() and task.exception() is not None:
+                if cache.get(key) is task:
+                    del cache[key]
+
+        task.add_done_callback(_on_done)
+    return None
+
+
+@dataclasses.dataclass
+class JobService:
+    """Fire-and-forget research jobs executed by background workers.
+
+    submit() enqueues a name and returns a job id immediately; get() awaits
+    the job's result. Identical names submitted while a job is still in
+    flight share one Future, so duplicate requests cost nothing extra.
+    """
+
+    flow: "BaseResearchFlow"
+    num_workers: int = 2
+    queue: asyncio.Queue = dataclasses.field(default_factory=asyncio.Queue)
+    jobs: dict = dataclasses.field(default_factory=dict)
+    pending: dict = dataclasses.field(default_factory=dict)
+    workers: list = dataclasses.field(default_factory=list)
+
+    def start(self):
+        """Spawns the worker tasks; call from a running event loop."""
+        self.workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.num_workers)
+        ]
+
+    def submit(self, person_name: str) -> str:
+        """Enqueues a research job and returns its job id."""
+        key = person_name.strip().lower()
+        future = self.pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.pending[key] = future
+            self.queue.put_nowait((person_name, key, future))
+        job_id = secrets.token_hex(16)
+        self.jobs[job_id] = future
+        return job_id
+
+    async def get(self, job_id: str) -> str:
+        """Awaits and returns the result of a submitted job.
+
+        Job ids are single-use: the entry is evicted on retrieval so the
+        registry stays bounded in a long-lived process.
+        """
+        return await self.jobs.pop(job_id)
+
+    async def _worker(self):
+        while True:
+            person_name, key, future = await self.queue.get()
+            try:
+                answer = await self.flow.research_person(
+                    person_name, session_id=secrets.token_hex(16)
+                )
+                if not future.done():
+                    future.set_result(answer)
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            finally:
+                self.pending.pop(key, None)
+                self.queue.task_done()
+
+
+# Agents whose text is user-facing; research notes and review verdicts
+# from the other agents stay out of the public stream.
+_STREAM_AUTHORS = ("AnswerAgent", "RefinerAgent")
+
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
+_REVIEW_RE = re.compile(r"^(APPROVED|NEEDS_IMPROVEMENT):\s*([^|]*)")
+
+# Each research block is trimmed to roughly this many characters
+# (~1500 tokens) before downstream agents re-read it in their prompts.
+_COMPRESS_CHAR_BUDGET = 6000
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def _compress_text(text: str, budget: int = _COMPRESS_CHAR_BUDGET) -> str:
+    """Extractively compresses text to the character budget.
+
+    Sentences are scored by the summed inverse frequency of their terms (a
+    dependency-free stand-in for BM25 ranking, favouring sentences with
+    rare, informative terms) and the best ones are kept in their original
+    order until the budget is filled.
+    """
+    if len(text) <= budget:
+        return text
+    sentences = _SENTENCE_RE.split(text)
+    term_freq = Counter(
+        word
+        for sentence in sentences
+        for word in set(_WORD_RE.findall(sentence.lower()))
+    )
+
+    def _score(sentence: str) -> float:
+        words = set(_WORD_RE.findall(sentence.lower()))
+        return sum(1.0 / term_freq[word] for word in words)
+
+    ranked = sorted(range(len(sentences)), key=lambda i: _score(sentences[i]),
+                    reverse=True)
+    kept: set[int] = set()
+    total = 0
+    for i in ranked:
+        length = len(sentences[i]) + 1
+        if total + length > budget:
+            continue
+        kept.add(i)
+        total += length
+    compressed = " ".join(sentences[i] for i in sorted(kept))
+    # A boundary-free blob has no sentence that fits the budget; a plain
+    # prefix slice beats returning nothing.
+    return compressed if compressed else text[:budget]
+
+
+def _compress_research_callback(output_key: str):
+    """Builds an after_agent_callback that trims one research block.
+
+    Tavily blocks are pasted verbatim into the answer/reviewer/refiner
+    prompts, so every downstream LLM call re-pays for their tokens;
+    compressing once here saves that cost three times per pipeline.
+    """
+
+    def _compress(callback_context):
+        text = callback_context.state.get(output_key)
+        if text and len(text) > _COMPRESS_CHAR_BUDGET:
+            callback_context.state[output_key] = _compress_text(text)
+        return None
+
+    return _compress
+
+
+class ReviewGateAgent(BaseAgent):
+    """Skips the LLM reviewer when the summary trivially passes review.
+
+    A summary that has the right length, a year and a birth statement is
+    what the reviewer approves in practice, so spending a Gemini round-trip
+    (~1-3s) to confirm it is wasted. The gate checks those properties in
+    Python and only falls through to the wrapped reviewer agent when the
+    heuristic fails.
+
+    Any approval - heuristic or from the LLM reviewer - escalates, which is
+    the only signal (besides max_iterations) that makes the enclosing
+    LoopAgent stop; without it the refiner would rewrite an already
+    approved summary.
+    """
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        summary = ctx.session.state.get("answer_summary", "")
+        word_count = len(summary.split())
+        if (
+            50 <= word_count <= 120
+            and _YEAR_RE.search(summary)
+            and "born" in summary.lower()
+        ):
+            yield Event(
+                author=self.name,
+                invocation_id=ctx.invocation_id,
+                actions=EventActions(
+                    state_delta={"review_result": "APPROVED: heuristic pass"},
+                    escalate=True,
+                ),
+            )
+            return
+        review_text = ""
+        async for event in self.sub_agents[0].run_async(ctx):
+            if event.content and event.content.parts and event.content.parts[0].text:
+                review_text = event.content.parts[0].text
+            yield event
+        if review_text.strip().startswith("APPROVED"):
+            yield Event(
+                author=self.name,
+                invocation_id=ctx.invocation_id,
+                actions=EventActions(escalate=True),
+            )
+
+
+class BaseResearchFlow:
+    """Researches the early life of a politician with a multi-agent pipeline.
+
+    Four sub-research agents (birth, family, education, early politics) each
+    run one Tavily search. They are fanned out in a ParallelAgent since the
+    searches are independent and network-bound, so the research step costs
+    one round-trip of wall-clock instead of four. An answer agent then merges
+    the four research blocks from session state into a short summary.
+    """
+
+    def __init__(
+        self,
+        app_name: str = "early_life_researcher",
+        user_id: str = "default_user",
+        session_id: str | None = None,
+        max_concurrency: int = 8,
+        rate_per_min: int = 20,
+        remote_session: bool = False,
+    ):
+        self.app_name = app_name
+        self.user_id = user_id
+        self.remote_session = remote_session
+        # Allocated lazily in initialize_async when the caller does not
+        # provide one; flows constructed in bulk skip the id generation.
+        self.session_id = session_id
+        self.max_concurrency = max_concurrency
+        # Tavily's free tier allows ~20 requests/min; throttle proactively
+        # instead of burning requests on 429 retries.
+        self._bucket = _TokenBucket(rate_per_min)
+        self._answer_cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        # Set by initialize_async; the state getters must not blow up on a
+        # flow that has not researched anyone yet.
+        self.session = None
+        self._setup_tools()
+        self._setup_agents()
+        self._setup_workflow()
+
+    def _setup_tools(self):
+        """Assigns the process-wide Tavily search tool to this flow."""
+        self.tavily_tool = _get_tavily_tool()
+
+    def _setup_agents(self):
+        """Creates the parallel research fan-out and the answer agent.
+
+        Builds leaf agents only; _setup_workflow composes them into the
+        root chain. ADK allows each agent a single parent, so the concrete
+        class must wrap the shared agents exactly once.
+        """
+        self.research_agents = [
+            Agent(
+                name=f"{output_key}_agent",
+                model=MODEL,
+                instruction=sub_researcher_instructions.format(aspect=aspect),
+                tools=[self.tavily_tool],
+                output_key=output_key,
+                after_agent_callback=_compress_research_callback(output_key),
+            )
+            for output_key, aspect in research_aspects.items()
+        ]
+        (
+            self.birth_agent,
+            self.family_agent,
+            self.education_agent,
+            self.early_politics_agent,
+        ) = self.research_agents
+        self.research_parallel = ParallelAgent(
+            name="ParallelResearch",
+            sub_agents=self.research_agents,
+        )
+        self.answer_agent = Agent(
+            name="AnswerAgent",
+            model=MODEL,
+            instruction=answer_instructions,
+            output_key="answer_summary",
+        )
+
+    def _setup_workflow(self):
+        """Composes the leaf agents into this flow's root chain."""
+        self.base_workflow = SequentialAgent(
+            name="BaseResearchWorkflow",
+            sub_agents=[self.research_parallel, self.answer_agent],
+        )
+
+    @property
+    def workflow_agent(self):
+        """The root agent executed by the runner."""
+        return self.base_workflow
+
+    async def initialize_async(self):
+        """Finishes the async part of construction. Call before researching."""
+        await self._setup_session_and_runner()
+        self.job_service = JobService(flow=self)
+        self.job_service.start()
+
+    def submit_research(self, person_name: str) -> str:
+        """Enqueues a background research job and returns its job id."""
+        return self.job_service.submit(person_name)
+
+    async def get_result(self, job_id: str) -> str:
+        """Awaits the summary of a job returned by submit_research."""
+        return await self.job_service.get(job_id)
+
+    async def _setup_session_and_runner(self):
+        if self.session_id is None:
+            self.session_id = secrets.token_hex(16)
+        if self.remote_session:
+            # Session-service path, for callers that swap in a remote
+            # session backend.
+            self.session_service = InMemorySessionService()
+            self.runner = Runner(
+                agent=self.workflow_agent,
+                app_name=self.app_name,
+                session_service=self.session_service,
+            )
+        else:
+            # Embedded/library usage: InMemoryRunner skips the session-layer
+            # indirection entirely, which dominates per-call overhead.
+            self.runner = InMemoryRunner(
+                agent=self.workflow_agent,
+                app_name=self.app_name,
+            )
+            self.session_service = self.runner.session_service
+        # The in-memory session-service methods are synchronous in the
+        # pinned google-adk 0.5.0.
+        self.session = self.session_service.create_session(
+            app_name=self.app_name,
+            user_id=self.user_id,
+            session_id=self.session_id,
+        )
+        await self._warm_up()
+
+    async def _warm_up(self):
+        """Pays the cold-start cost before the first real request.
+
+        The first run_async call spends seconds on agent-app loading and on
+        opening the HTTPS/OAuth connection to Gemini. Firing a tiny probe
+        here moves that out of the first research_person call. The probe is
+        abandoned after its first event and the session is recreated so no
+        warm-up state leaks into real research.
+        """
+        try:
+            async for _ in self.runner.run_async(
+                user_id=self.user_id,
+                session_id=self.session_id,
+                new_message=types.Content(
+                    role="user",
+                    parts=[types.Part(text="__warmup__ respond with OK")],
+                ),
+            ):
+                break
+        except Exception:
+            # Warm-up is best-effort; a failed probe must not block startup.
+            return
+        self.session_service.delete_session(
+            app_name=self.app_name,
+            user_id=self.user_id,
+            session_id=self.session_id,
+        )
+        self.session = self.session_service.create_session(
+            app_name=self.app_name,
+            user_id=self.user_id,
+            session_id=self.session_id,
+        )
+
+    async def research_person(
+        self, person_name: str, session_id: str | None = None
+    ) -> str:
+        """Runs the full workflow for one person and returns the summary.
+
+        Args:
+            person_name (str): The name of the politician to research.
+            session_id (str): Session to run in. Defaults to the flow's own
+                session; batch runs pass a fresh id per name so that the
+                research state of concurrent names stays isolated.
+
+        Returns:
+            str: The final early-life summary.
+        """
+        cache_key = person_name.strip().lower()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        if session_id is None:
+            session_id = self.session_id
+        async for _ in self._run_events(person_name, session_id):
+            pass
+        return await self._finalize(session_id, cache_key)
+
+    async def stream_research_person(
+        self, person_name: str, session_id: str | None = None
+    ) -> AsyncIterator[str]:
+        """Yields text chunks while the workflow runs.
+
+        The run executes with SSE streaming enabled, so summary tokens
+        arrive as partial chunks instead of one blob per agent. Only text
+        from the summary-writing agents (answer and refiner) is yielded;
+        research notes and review verdicts stay internal. On a cache hit
+        the stored summary is yielded as a single chunk.
+
+        Args:
+            person_name (str): The name of the politician to research.
+            session_id (str): Session to run in; see research_person.
+
+        Yields:
+            str: Summary text, in order of production.
+        """
+        cache_key = person_name.strip().lower()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        if session_id is None:
+            session_id = self.session_id
+        async for event in self._run_events(
+            person_name, session_id, streaming=True
+        ):
+            if event.author not in _STREAM_AUTHORS:
+                continue
+            if not event.content or not event.content.parts:
+                continue
+            text = event.content.parts[0].text
+            # In SSE mode ADK follows the partial deltas of a turn with a
+            # final event carrying the full accumulated text; yielding that
+            # too would repeat the whole summary.
+            if text and event.partial:
+                yield text
+        await self._finalize(session_id, cache_key)
+
+    async def _run_events(
+        self, person_name: str, session_id: str, streaming: bool = False
+    ):
+        """Runs the workflow in the given session, yielding raw ADK events."""
+        if session_id != self.session_id:
+            self.session_service.create_session(
+                app_name=self.app_name,
+                user_id=self.user_id,
+                session_id=session_id,
+            )
+        content = types.Content(
+            role="user",
+            parts=[types.Part(text=f"Research the early life of {person_name}.")],
+        )
+        run_config = RunConfig(
+            streaming_mode=StreamingMode.SSE if streaming else StreamingMode.NONE
+        )
+        token = _tavily_query_cache.set({})
+        try:
+            async for event in self.runner.run_async(
+                user_id=self.user_id,
+                session_id=session_id,
+                new_message=content,
+                run_config=run_config,
+            ):
+                yield event
+        finally:
+            _tavily_query_cache.reset(token)
+
+    async def _finalize(self, session_id: str, cache_key: str) -> str:
+        """Reads back the finished session and caches its summary."""
+        session = self.session_service.get_session(
+            app_name=self.app_name,
+            user_id=self.user_id,
+            session_id=session_id,
+        )
+        if session_id == self.session_id:
+            self.session = session
+        answer = (session.state or {}).get("answer_summary", "")
+        if answer:
+            self._cache_put(cache_key, answer)
+        return answer
+
+    async def research_people(self, names: list[str]) -> list[str]:
+        """Researches many people concurrently, bounded by the rate limit.
+
+        Args:
+            names (list[str]): The politicians to research.
+
+        Returns:
+            list[str]: One early-life summary per name, in input order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _one(name: str) -> str:
+            async with semaphore:
+                await self._bucket.acquire()
+                return await self.research_person(
+                    name, session_id=secrets.token_hex(16)
+                )
+
+        return await asyncio.gather(*[_one(name) for name in names])
+
+    def _cache_get(self, key: str) -> str | None:
+        entry = self._answer_cache.get(key)
+        if entry is None:
+            return None
+        answer, expires_at = entry
+        if time.monotonic() > expires_at:
+            del self._answer_cache[key]
+            return None
+        self._answer_cache.move_to_end(key)
+        return answer
+
+    def _cache_put(self, key: str, answer: str):
+        self._answer_cache[key] = (answer, time.monotonic() + CACHE_TTL_SECONDS)
+        self._answer_cache.move_to_end(key)
+        while len(self._answer_cache) > CACHE_MAX_ENTRIES:
+            self._answer_cache.popitem(last=False)
+
+    def _state(self) -> dict:
+        return self.session.state if self.session else {}
+
+    def get_research_data(self) -> str:
+        """Returns the four research blocks joined into one text blob."""
+        state = self._state()
+        return "\n\n".join(
+            state.get(key, "") for key in research_aspects if state.get(key)
+        )
+
+    def get_answer_summary(self) -> str:
+        """Returns the latest early-life summary from session state."""
+        return self._state().get("answer_summary", "")
+
+
+class IterativeResearchWorkflow(BaseResearchFlow):
+    """Extends the base flow with a review/refine loop after the answer."""
+
+    def _setup_agents(self):
+        super()._setup_agents()
+        self._review_parse = None
+        self.reviewer_agent = Agent(
+            name="ReviewerAgent",
+            model=MODEL,
+            instruction=reviewer_instructions,
+            output_key="review_result",
+        )
+        self.refiner_agent = Agent(
+            name="RefinerAgent",
+            model=MODEL,
+            instruction=refiner_instructions,
+            tools=[self.tavily_tool],
+            output_key="answer_summary",
+        )
+        self.review_gate = ReviewGateAgent(
+            name="ReviewGate",
+            sub_agents=[self.reviewer_agent],
+            after_agent_callback=_speculative_prefetch,
+        )
+        self.review_loop = LoopAgent(
+            name="ReviewLoop",
+            sub_agents=[self.review_gate, self.refiner_agent],
+            max_iterations=2,
+        )
+
+    def _setup_workflow(self):
+        self.iterative_workflow = SequentialAgent(
+            name="IterativeResearchWorkflow",
+            sub_agents=[
+                self.research_parallel,
+                self.answer_agent,
+                self.review_loop,
+            ],
+        )
+
+    @property
+    def workflow_agent(self):
+        return self.iterative_workflow
+
+    def _parse_review(self, review_result: str) -> tuple[str | None, str | None]:
+        """Parses a review_result into (status, feedback) in one regex pass.
+
+        The two accessors are typically called back to back on the same
+        string, so the last parse is memoized by object identity.
+        """
+        cached = self._review_parse
+        if cached is not None and cached[0] is review_result:
+            return cached[1]
+        match = _REVIEW_RE.match(review_result) if review_result else None
+        parsed = (match.group(1), match.group(2).strip()) if match else (None, None)
+        self._review_parse = (review_result, parsed)
+        return parsed
+
+    def get_review_feedback(self) -> str:
+        """Returns the editor feedback from the last review, if any."""
+        feedback = self._parse_review(self._state().get("review_result", ""))[1]
+        return feedback or ""
+
+    def get_review_status(self) -> str:
+        """Returns 'approved', 'needs_improvement' or 'unknown'."""
+        status = self._parse_review(self._state().get("review_result", ""))[0]
+        if status == "APPROVED":
+            return "approved"
+        if status == "NEEDS_IMPROVEMENT":
+            return "needs_improvement"
+        return "unknown"
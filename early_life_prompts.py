@@ -0,0 +1,121 @@
+"""Prompt templates for the early-life research workflow.
+
+Each prompt is a static ``*_rules`` prefix followed by a dynamic
+``*_context`` suffix. The rules never change between invocations, so with
+the static part leading, repeated calls share a byte-identical prompt
+prefix that Gemini's implicit prefix caching can reuse; only the context
+part varies per person.
+"""
+
+# The four independent aspects of a politician's early life that we research.
+# Keys double as the session-state output keys of the parallel sub-agents.
+research_aspects = {
+    "research_birth": (
+        "date and place of birth, full name and basic biographical facts"
+    ),
+    "research_family": (
+        "family background, parents, siblings and upbringing"
+    ),
+    "research_education": (
+        "schooling, university education and academic qualifications"
+    ),
+    "research_early_politics": (
+        "earliest political activity, party membership and first steps into"
+        " politics"
+    ),
+}
+
+sub_researcher_instructions = """You are a research assistant specialised in the early life of politicians.
+
+Given the name of a politician, use the Tavily search tool to find reliable
+information about one specific aspect of their early life: {aspect}.
+
+Issue one focused search query for this aspect. Report the raw findings as
+plain text, including the sources they came from. Do not invent facts; only
+report what the search returned. Do not cover other aspects of the person's
+life.
+"""
+
+answer_rules = """You are a biographer writing a short summary of a politician's early life.
+
+You will be given research notes gathered about the person, one block per
+aspect. Merge these notes into a single coherent summary of the person's
+early life in 50 to 100 words. Mention when and where they were born, their
+family background, their education and how they entered politics. Only use
+facts present in the research notes, and mention at least one source.
+"""
+
+answer_context = """Research notes:
+
+Birth and basic facts:
+{research_birth}
+
+Family background:
+{research_family}
+
+Education:
+{research_education}
+
+Early political activity:
+{research_early_politics}
+"""
+
+answer_instructions = answer_rules + "\n" + answer_context
+
+reviewer_rules = """You are a strict editor reviewing a summary of a politician's early life.
+
+Check that the summary:
+- is between 50 and 100 words,
+- states when and where the person was born,
+- covers family background, education and early political activity,
+- cites at least one source,
+- contains no obvious contradictions.
+
+If the summary satisfies all checks, respond with exactly:
+APPROVED: <one short sentence on why>
+
+Otherwise respond with exactly:
+NEEDS_IMPROVEMENT: <what is missing or wrong> | <search queries that would fill the gaps, separated by semicolons>
+"""
+
+reviewer_context = """Summary to review:
+{answer_summary}
+"""
+
+reviewer_instructions = reviewer_rules + "\n" + reviewer_context
+
+refiner_rules = """You are a biographer improving a summary of a politician's early life.
+
+You will be given the current summary, editor feedback on it, and the
+research notes it was based on. Rewrite the summary so that it addresses
+the editor's feedback while staying between 50 and 100 words and only using
+facts from the research notes. If the editor's feedback lists search queries
+for missing information, run them with the Tavily search tool - issue them
+all in a single response so they execute concurrently - and use the
+results. If information is still missing afterwards, list the topics still
+to be researched at the end on a line starting with
+"ADDITIONAL RESEARCH NEEDED:".
+"""
+
+refiner_context = """Current summary:
+{answer_summary}
+
+Editor feedback:
+{review_result}
+
+Research notes:
+
+Birth and basic facts:
+{research_birth}
+
+Family background:
+{research_family}
+
+Education:
+{research_education}
+
+Early political activity:
+{research_early_politics}
+"""
+
+refiner_instructions = refiner_rules + "\n" + refiner_context
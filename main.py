@@ -0,0 +1,41 @@
+"""Entry point: research the early life of a politician from the CLI."""
+
+import asyncio
+import sys
+
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    # uvloop is a nice-to-have; the stock event loop works everywhere.
+    pass
+
+from base_researcher import IterativeResearchWorkflow
+
+
+async def main(person_name: str):
+    flow = IterativeResearchWorkflow()
+    await flow.initialize_async()
+
+    print("=== Live output ===")
+    async for chunk in flow.stream_research_person(person_name):
+        print(chunk, end="", flush=True)
+    print()
+    answer = flow.get_answer_summary()
+
+    research_data = flow.get_research_data()
+    print("=== Research data ===")
+    print(
+        research_data
+        if len(research_data) <= 1500
+        else f"{research_data[:1500]}..."
+    )
+    print("=== Summary ===")
+    print(answer)
+    print(f"Review: {flow.get_review_status()} ({flow.get_review_feedback()})")
+
+
+if __name__ == "__main__":
+    name = sys.argv[1] if len(sys.argv) > 1 else "Pedro Sanchez"
+    asyncio.run(main(name))
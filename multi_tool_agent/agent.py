@@ -2,6 +2,20 @@ import datetime
 from zoneinfo import ZoneInfo
 from google.adk.agents import Agent
 
+# Lookup tables keyed by lowercased city name, built once at import so the
+# hot tool path is a single dict lookup with no per-call allocations.
+_WEATHER_REPORTS = {
+    "new york": (
+        "The weather in New York is sunny with a temperature of 25 degrees"
+        " Celsius (77 degrees Fahrenheit)."
+    ),
+}
+
+_TIMEZONES = {
+    "new york": ZoneInfo("America/New_York"),
+}
+
+
 def get_weather(city: str) -> dict:
     """Retrieves the current weather report for a specified city.
 
@@ -11,19 +25,13 @@ def get_weather(city: str) -> dict:
     Returns:
         dict: status and result or error msg.
     """
-    if city.lower() == "new york":
-        return {
-            "status": "success",
-            "report": (
-                "The weather in New York is sunny with a temperature of 25 degrees"
-                " Celsius (77 degrees Fahrenheit)."
-            ),
-        }
-    else:
+    report = _WEATHER_REPORTS.get(city.strip().lower())
+    if report is None:
         return {
             "status": "error",
             "error_message": f"Weather information for '{city}' is not available.",
         }
+    return {"status": "success", "report": report}
 
 
 def get_current_time(city: str) -> dict:
@@ -35,10 +43,8 @@ def get_current_time(city: str) -> dict:
     Returns:
         dict: status and result or error msg.
     """
-
-    if city.lower() == "new york":
-        tz_identifier = "America/New_York"
-    else:
+    tz = _TIMEZONES.get(city.strip().lower())
+    if tz is None:
         return {
             "status": "error",
             "error_message": (
@@ -46,7 +52,6 @@ def get_current_time(city: str) -> dict:
             ),
         }
 
-    tz = ZoneInfo(tz_identifier)
     now = datetime.datetime.now(tz)
     report = (
         f'The current time in {city} is {now.strftime("%Y-%m-%d %H:%M:%S %Z%z")}'
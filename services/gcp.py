@@ -1,20 +1,27 @@
+import functools
+
 from google.cloud import secretmanager
-import os
 
-PATH = os.get('PATH')
 
-def get_secret() -> str:
+@functools.lru_cache(maxsize=1)
+def _client() -> secretmanager.SecretManagerServiceClient:
+    """Shared Secret Manager client; gRPC channel setup is paid once."""
+    return secretmanager.SecretManagerServiceClient()
+
+
+@functools.lru_cache(maxsize=64)
+def get_secret(
+    project: str = "733286937483",
+    secret: str = "ai-agent-ai-key",
+    version: str = "latest",
+) -> str:
     """
     Retrieve secret from GCP Secret Manager
     """
-    if PATH:
-        os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = PATH
-        
-    secret_client = secretmanager.SecretManagerServiceClient()
-    name = secret_client.secret_version_path(
-        project="733286937483",
-        secret="ai-agent-ai-key",
-        secret_version="latest"
+    name = _client().secret_version_path(
+        project=project,
+        secret=secret,
+        secret_version=version,
     )
-    response = secret_client.access_secret_version(request={"name": name})
+    response = _client().access_secret_version(request={"name": name})
     return response.payload.data.decode("UTF-8")
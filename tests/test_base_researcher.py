@@ -0,0 +1,137 @@
+"""Smoke tests for the early-life research flow. No network, no LLM calls."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import base_researcher
+from base_researcher import (
+    BaseResearchFlow,
+    IterativeResearchWorkflow,
+    _compress_text,
+    _parse_gap_queries,
+    _TokenBucket,
+)
+
+
+def test_base_flow_construction():
+    flow = BaseResearchFlow()
+    assert flow.workflow_agent.name == "BaseResearchWorkflow"
+    names = [agent.name for agent in flow.workflow_agent.sub_agents]
+    assert names == ["ParallelResearch", "AnswerAgent"]
+
+
+def test_iterative_flow_construction():
+    flow = IterativeResearchWorkflow()
+    assert flow.workflow_agent.name == "IterativeResearchWorkflow"
+    names = [agent.name for agent in flow.workflow_agent.sub_agents]
+    assert names == ["ParallelResearch", "AnswerAgent", "ReviewLoop"]
+
+
+def test_review_accessors_without_session():
+    flow = IterativeResearchWorkflow()
+    assert flow.get_review_status() == "unknown"
+    assert flow.get_review_feedback() == ""
+
+
+def test_parse_review():
+    flow = IterativeResearchWorkflow()
+    assert flow._parse_review("APPROVED: looks good") == ("APPROVED", "looks good")
+    status, feedback = flow._parse_review(
+        "NEEDS_IMPROVEMENT: missing dates | name school; name university"
+    )
+    assert status == "NEEDS_IMPROVEMENT"
+    assert feedback == "missing dates"
+    assert flow._parse_review("") == (None, None)
+
+
+def test_parse_gap_queries():
+    review = "NEEDS_IMPROVEMENT: missing education | name school; name university"
+    assert _parse_gap_queries(review) == ["name school", "name university"]
+    assert _parse_gap_queries("APPROVED: fine") == []
+
+
+def test_compress_text_short_passthrough():
+    assert _compress_text("short text.", budget=100) == "short text."
+
+
+def test_compress_text_over_budget():
+    text = " ".join(f"Sentence number {i} mentions fact {i}." for i in range(100))
+    compressed = _compress_text(text, budget=200)
+    assert 0 < len(compressed) <= 200
+
+
+def test_compress_text_boundary_free_blob_falls_back():
+    blob = "x" * 500
+    assert _compress_text(blob, budget=100) == "x" * 100
+
+
+def test_answer_cache_roundtrip_and_expiry():
+    flow = BaseResearchFlow()
+    flow._cache_put("pedro sanchez", "a summary")
+    assert flow._cache_get("pedro sanchez") == "a summary"
+    flow._answer_cache["pedro sanchez"] = ("a summary", time.monotonic() - 1)
+    assert flow._cache_get("pedro sanchez") is None
+
+
+def test_answer_cache_lru_eviction():
+    flow = BaseResearchFlow()
+    for i in range(base_researcher.CACHE_MAX_ENTRIES + 5):
+        flow._cache_put(f"person {i}", "s")
+    assert len(flow._answer_cache) == base_researcher.CACHE_MAX_ENTRIES
+    assert flow._cache_get("person 0") is None
+
+
+def test_token_bucket_acquires_available_token():
+    bucket = _TokenBucket(rate_per_min=60)
+    asyncio.run(bucket.acquire())
+
+
+class _StubEvent:
+    """Event shaped like ADK's: partial deltas, then an aggregated final."""
+
+    def __init__(self, author, text, partial):
+        self.author = author
+        self.partial = partial
+        self.content = SimpleNamespace(parts=[SimpleNamespace(text=text)])
+
+    def is_final_response(self):
+        return not self.partial
+
+
+class _StubRunner:
+    def __init__(self, events):
+        self._events = events
+
+    async def run_async(self, **kwargs):
+        for event in self._events:
+            yield event
+
+
+class _StubSessionService:
+    def __init__(self, state):
+        self._state = state
+
+    def get_session(self, **kwargs):
+        return SimpleNamespace(state=self._state)
+
+
+def test_stream_yields_each_summary_chunk_once():
+    flow = BaseResearchFlow()
+    flow.runner = _StubRunner(
+        [
+            _StubEvent("research_birth_agent", "notes", False),
+            _StubEvent("AnswerAgent", "Hello ", True),
+            _StubEvent("AnswerAgent", "world.", True),
+            # SSE re-emits the accumulated turn as a final event; it must
+            # not be yielded again.
+            _StubEvent("AnswerAgent", "Hello world.", False),
+            _StubEvent("ReviewerAgent", "APPROVED: fine", False),
+        ]
+    )
+    flow.session_service = _StubSessionService({"answer_summary": "Hello world."})
+
+    async def _collect():
+        return [c async for c in flow.stream_research_person("Test Person")]
+
+    assert asyncio.run(_collect()) == ["Hello ", "world."]